@@ -1,4 +1,5 @@
 import os
+import re
 import json
 import importlib.util
 import logging
@@ -8,6 +9,13 @@ from core.config_manager import ConfigManager, AgentConfigManager
 from core.llm_manager import LLMManager
 from core.context_manager import ContextManager
 
+# Potential API keys, tokens and passwords, compiled once for every log line that gets sanitized
+_REDACTION_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'(api[_-]?key|token|password|secret)["\']?\s*[:=]\s*["\']?[\w\-_]+',
+    r'Bearer\s+[\w\-_]+',
+    r'[A-Za-z0-9+/]{32,}={0,2}',  # Base64-like strings
+))
+
 class AgentOrchestrator:
     def __init__(self, config_manager: ConfigManager):
         self.config_manager = config_manager
@@ -141,16 +149,7 @@ class AgentOrchestrator:
             
         # Basic sanitization - remove potential sensitive patterns
         # This is a simple implementation; in production, you might want more sophisticated filtering
-        import re
-        
-        # Remove potential API keys, tokens, passwords
-        patterns_to_redact = [
-            r'(api[_-]?key|token|password|secret)["\']?\s*[:=]\s*["\']?[\w\-_]+',
-            r'Bearer\s+[\w\-_]+',
-            r'[A-Za-z0-9+/]{32,}={0,2}',  # Base64-like strings
-        ]
-        
-        for pattern in patterns_to_redact:
-            data = re.sub(pattern, '[REDACTED]', data, flags=re.IGNORECASE)
+        for pattern in _REDACTION_PATTERNS:
+            data = pattern.sub('[REDACTED]', data)
             
         return data
@@ -1,6 +1,6 @@
 import os
 from pathlib import Path
-from typing import Dict, Optional, TYPE_CHECKING, Set
+from typing import Dict, Optional, TYPE_CHECKING, Set, Tuple
 from agents.base_agent import BaseAgent
 import re
 
@@ -15,7 +15,8 @@ class ProjectAnalysisAgent(BaseAgent):
     Stores the analysis in the ContextManager for other agents to use.
     """
     
-    def __init__(self, config: Optional[Dict] = None, llm_manager: Optional['LLMManager'] = None, context_manager: Optional['ContextManager'] = None):
+    def __init__(self, config: Optional[Dict] = None, llm_manager: Optional['LLMManager'] = None, context_manager: Optional['ContextManager'] = None,
+                 project_scan: Optional[Tuple[str, str]] = None):
         super().__init__(config, llm_manager, context_manager)
         
         # Default ignore patterns
@@ -31,6 +32,9 @@ class ProjectAnalysisAgent(BaseAgent):
         
         # Get project root from config or use current directory
         self.project_root = Path(self.config.get('project_root', os.getcwd()))
+        
+        # (directory_structure, key_files_content), filled on first scan unless the caller supplies one
+        self._project_scan: Optional[Tuple[str, str]] = project_scan
 
     def _should_ignore(self, path: Path) -> bool:
         """Check if a path should be ignored based on ignore patterns."""
@@ -118,6 +122,20 @@ class ProjectAnalysisAgent(BaseAgent):
                     
         return "\n".join(content)
 
+    def _scan_project(self) -> Tuple[str, str]:
+        """
+        Walk the project tree and read key files once per agent instance.
+        
+        Returns:
+            A (directory_structure, key_files_content) tuple, reused by later executions
+        """
+        if self._project_scan is None:
+            self._project_scan = (
+                self._analyze_directory_structure(self.project_root),
+                self._get_key_files_content()
+            )
+        return self._project_scan
+
     def _load_and_prepare_template(self, template_path: Path, context: Dict) -> str:
         """
         Load and process a markdown template file, replacing placeholders with dynamic content.
@@ -166,11 +184,8 @@ class ProjectAnalysisAgent(BaseAgent):
         """
         
         try:
-            # Generate directory structure
-            directory_structure = self._analyze_directory_structure(self.project_root)
-            
-            # Get key files content
-            key_files_content = self._get_key_files_content()
+            # Generate directory structure and key files content
+            directory_structure, key_files_content = self._scan_project()
             
             # Prepare template context
             template_context = {
@@ -2,25 +2,54 @@ import os
 import re
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, TYPE_CHECKING
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
 from agents.base_agent import BaseAgent
 
 if TYPE_CHECKING:
     from core.llm_manager import LLMManager
     from core.context_manager import ContextManager
 
+# {{ name }} or {{ context.name }}, matched in a single pass over the template
+_PLACEHOLDER_RE = re.compile(r'\{\{\s*([^{}\s]+)\s*\}\}')
+
+# Template path -> ((mtime_ns, size), content); shared by all instances
+_TEMPLATE_CACHE: Dict[Path, Tuple[Tuple[int, int], str]] = {}
+
+
+def _read_template_file(path: Path) -> str:
+    """
+    Read a template file, reusing the cached content while its mtime and size are unchanged.
+    
+    Raises:
+        FileNotFoundError: If the template file doesn't exist
+    """
+    stat = os.stat(path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _TEMPLATE_CACHE.get(path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    _TEMPLATE_CACHE[path] = (signature, content)
+    return content
+
 
 class PromptAssemblyAgent(BaseAgent):
     """
     An agent that dynamically constructs prompts by combining templates, context, and user input.
     """
     
-    def __init__(self, config: Optional[Dict] = None, llm_manager: Optional['LLMManager'] = None, context_manager: Optional['ContextManager'] = None):
+    def __init__(self, config: Optional[Dict] = None, llm_manager: Optional['LLMManager'] = None, context_manager: Optional['ContextManager'] = None,
+                 templates_path: Optional[Path] = None):
         super().__init__(config, llm_manager, context_manager)
         
-        # Get templates directory from config
+        # Get templates directory from config, unless the caller supplies one
         self.templates_directory = self.config.get('prompt_assembly_agent', {}).get('templates_directory', 'templates')
-        self.templates_path = Path(__file__).parent / self.templates_directory
+        if templates_path is not None:
+            self.templates_path = Path(templates_path)
+        else:
+            self.templates_path = Path(__file__).parent / self.templates_directory
         
         # Set up output directory (same as issue generator)
         self.output_dir = Path(self.config.get("project.root", Path.cwd())) / "generated-issues"
@@ -45,14 +74,12 @@ class PromptAssemblyAgent(BaseAgent):
         template_file_path = self.templates_path / template_name
         
         try:
-            with open(template_file_path, 'r', encoding='utf-8') as f:
-                return f.read()
+            return _read_template_file(template_file_path)
         except FileNotFoundError:
             # Try to use default template if specified template not found
             default_template_path = self.templates_path / 'example_template.md'
             try:
-                with open(default_template_path, 'r', encoding='utf-8') as f:
-                    return f.read()
+                return _read_template_file(default_template_path)
             except FileNotFoundError:
                 raise FileNotFoundError(f"Template file not found: {template_file_path} and default template not found: {default_template_path}")
         except Exception as e:
@@ -95,19 +122,18 @@ class PromptAssemblyAgent(BaseAgent):
         Returns:
             Template with placeholders replaced
         """
-        result = template_content
+        def resolve(match):
+            name = match.group(1)
+            # Regular placeholders (format: {{ placeholder_name }})
+            if name in placeholders:
+                return str(placeholders[name])
+            # Context placeholders (format: {{ context.key_name }})
+            if name.startswith('context.') and name[len('context.'):] in context_values:
+                return str(context_values[name[len('context.'):]])
+            # Unknown placeholders are left as they are
+            return match.group(0)
         
-        # Replace regular placeholders (format: {{ placeholder_name }})
-        for key, value in placeholders.items():
-            placeholder_pattern = r'\{\{\s*' + re.escape(key) + r'\s*\}\}'
-            result = re.sub(placeholder_pattern, str(value), result)
-        
-        # Replace context placeholders (format: {{ context.key_name }})
-        for key, value in context_values.items():
-            context_placeholder_pattern = r'\{\{\s*context\.' + re.escape(key) + r'\s*\}\}'
-            result = re.sub(context_placeholder_pattern, str(value), result)
-            
-        return result
+        return _PLACEHOLDER_RE.sub(resolve, template_content)
     
     def _get_next_sequence_number(self) -> int:
         """Get the next sequential number for file naming."""
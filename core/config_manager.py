@@ -1,10 +1,119 @@
+import importlib.resources
 import json
-from typing import Any, Dict
+import os
+from typing import Any, Dict, Union
 import copy
+import functools
 import logging
-from pathlib import Path
+import math
+import sys
 
-from jsonschema import validate, ValidationError
+from jsonschema import validators
+from jsonschema.exceptions import best_match
+
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _parse_json(data: bytes) -> Any:
+    """
+    Parses JSON bytes, using orjson when it is installed.
+    Input orjson rejects is re-parsed with json.loads, so the NaN/Infinity literals and
+    out-of-range numbers the stdlib accepts still load; malformed input raises json.JSONDecodeError.
+    Note that orjson reads integers wider than 64 bits as floats.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+def _load_json_file(path: Union[str, os.PathLike]) -> Any:
+    """Parses a JSON file."""
+    with open(path, 'rb') as f:
+        return _parse_json(f.read())
+
+def _intern_keys(obj: Any) -> Any:
+    """
+    Rebuilds parsed JSON with every dict key interned.
+    Config keys repeat heavily across sections and agents, so interning shares one str per key
+    and lets dict lookups with literal keys match on identity.
+    """
+    if isinstance(obj, dict):
+        return {sys.intern(k): _intern_keys(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_intern_keys(item) for item in obj]
+    return obj
+
+def _is_json_value(value: Any) -> bool:
+    """
+    Returns True if a value is made only of the types a JSON parser produces.
+    Exact type checks, since orjson would silently serialize subclasses such as str enums.
+    """
+    value_type = type(value)
+    if value_type is dict:
+        return all(type(k) is str and _is_json_value(v) for k, v in value.items())
+    if value_type is list:
+        return all(_is_json_value(item) for item in value)
+    if value_type is float:
+        # orjson writes NaN and infinities as null
+        return math.isfinite(value)
+    return value is None or value_type in (str, int, bool)
+
+def _clone_config(value: Any, pure_json: bool = False) -> Any:
+    """
+    Deep-copies a config value.
+    Trees known to hold only parsed JSON (pure_json=True) go through an orjson round-trip
+    when available; anything else uses copy.deepcopy, since orjson would turn dates, UUIDs,
+    enums and tuples into their JSON forms.
+    """
+    if value is None or isinstance(value, (str, int, float)):
+        # Immutable scalars need no copy
+        return value
+    if pure_json and orjson is not None:
+        try:
+            return orjson.loads(orjson.dumps(value))
+        except TypeError:
+            pass
+    return copy.deepcopy(value)
+
+
+@functools.lru_cache(maxsize=512)
+def _split_path(key: str) -> tuple:
+    """Splits a dotted config key into its segments, caching the result."""
+    return tuple(key.split('.'))
+
+@functools.cache
+def _schema_validators():
+    """
+    Loads the configuration schema and compiles its validators on first use.
+    Returns the schema, a jsonschema validator and, if fastjsonschema is installed, a compiled checker.
+    Processes that never validate a config never pay for parsing or compiling the schema.
+    """
+    # Read through importlib.resources so the schema resolves however the package is installed
+    schema_path = importlib.resources.files(__package__).joinpath("config_schema.json")
+    try:
+        schema = _parse_json(schema_path.read_bytes())
+    except FileNotFoundError:
+        raise RuntimeError(f"Configuration schema file not found: {schema_path}")
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Malformed JSON in configuration schema file: {schema_path} - {e}")
+
+    # Build the validator once; jsonschema.validate would re-check the schema on every call
+    validator_cls = validators.validator_for(schema)
+    validator_cls.check_schema(schema)
+    # fastjsonschema generates a specialised checker for the happy path when installed;
+    # use_default=False stops it from writing schema defaults into the validated config
+    fast_validate = fastjsonschema.compile(schema, use_default=False) if fastjsonschema else None
+    return schema, validator_cls(schema), fast_validate
 
 class ConfigValidationError(Exception):
     """Custom exception for configuration validation errors."""
@@ -13,42 +122,63 @@ class ConfigValidationError(Exception):
 class ConfigManager:
     _instance = None
     _config: Dict[str, Any] = {}
-    _schema: Dict[str, Any] = {}
 
     def __new__(cls):
         if cls._instance is None:
-            cls._instance = super(ConfigManager, cls).__new__(cls)
-            cls._instance._load_schema()
             cls._config = {} # Initialize _config for the new instance
-            cls._instance._logging_configured = False
+            cls._instance = cls._new_instance()
         return cls._instance
 
-    def _load_schema(self) -> None:
-        schema_path = Path(__file__).parent / "config_schema.json"
-        try:
-            with open(schema_path, 'r') as f:
-                self._schema = json.load(f)
-        except FileNotFoundError:
-            raise RuntimeError(f"Configuration schema file not found: {schema_path}")
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Malformed JSON in configuration schema file: {schema_path} - {e}")
+    @classmethod
+    def _new_instance(cls) -> "ConfigManager":
+        """
+        Creates a fully initialized ConfigManager that is not registered as the singleton.
+        Lets tests inject an isolated instance instead of resetting _instance.
+        """
+        instance = super(ConfigManager, cls).__new__(cls)
+        instance._config = {}
+        instance._logging_configured = False
+        instance._load_cache = {}
+        instance._agent_paths = None
+        instance._agent_overrides = {}
+        instance._agent_configs = {}
+        instance._cache_source = None
+        # True while _config holds only values that came from the JSON parser
+        instance._config_is_json = True
+        return instance
 
-    def load_config(self, config_path: str) -> None:
+    def load_config(self, config_path: Union[str, os.PathLike], validate: bool = True) -> None:
         """
         Loads and parses the JSON file and validates it against the schema.
+        Reloading a path whose mtime and size are unchanged reuses the previously validated
+        config instead of re-reading it. Pass validate=False to skip validation for trusted configs.
         Raises FileNotFoundError if the path is invalid or ValueError if the JSON is malformed.
         Raises ConfigValidationError if the config does not match the schema.
         """
+        config_path = os.fspath(config_path)
         try:
-            with open(config_path, 'r') as f:
-                loaded_config = json.load(f)
-            self._validate_config(loaded_config)
+            stat = os.stat(config_path)
+            signature = (stat.st_mtime_ns, stat.st_size)
+            cached = self._load_cache.get(config_path)
+            if cached is not None and cached[0] == signature:
+                # _intern_keys rebuilds every dict and list, so this is also a fresh copy
+                loaded_config = _intern_keys(cached[1])
+            else:
+                loaded_config = _intern_keys(_load_json_file(config_path))
+                if validate:
+                    self._validate_config(loaded_config)
+                    # Keep a pristine copy, since set() mutates the live config in place
+                    self._load_cache[config_path] = (signature, _intern_keys(loaded_config))
             self._config = loaded_config
+            self._clear_caches()
+            self._config_is_json = True
             # Configure logging after loading config
             self.configure_logging()
         except FileNotFoundError:
             # It's okay for the global config to not exist, just means we have an empty config
             self._config = {}
+            self._clear_caches()
+            self._config_is_json = True
             # Still configure logging with defaults
             self.configure_logging()
         except json.JSONDecodeError as e:
@@ -98,10 +228,18 @@ class ConfigManager:
         Validates the given configuration dictionary against the loaded schema.
         Raises ConfigValidationError if validation fails.
         """
-        try:
-            validate(instance=config, schema=self._schema)
-        except ValidationError as e:
-            raise ConfigValidationError(f"Configuration validation error: {e.message} in {e.path}")
+        _, validator, fast_validate = _schema_validators()
+        if fast_validate is not None:
+            try:
+                fast_validate(config)
+                return
+            except fastjsonschema.JsonSchemaException:
+                # Fall through so the error is reported in jsonschema's wording
+                pass
+
+        error = best_match(validator.iter_errors(config))
+        if error is not None:
+            raise ConfigValidationError(f"Configuration validation error: {error.message} in {error.path}")
 
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -114,25 +252,26 @@ class ConfigManager:
         """
         Returns a copy of the entire configuration dictionary.
         """
-        return copy.deepcopy(self._config)
+        self._check_caches()
+        return _clone_config(self._config, self._config_is_json)
 
-    def get_merged_config(self, override_config_path: str) -> Dict[str, Any]:
+    def get_merged_config(self, override_config_path: Union[str, os.PathLike]) -> Dict[str, Any]:
         """
         Loads an override config and deeply merges it on top of the base config.
         Validates the merged configuration.
         Returns a new dictionary and does not modify the singleton's state.
         """
+        override_config_path = os.fspath(override_config_path)
         base_config = self.get_config()
         try:
-            with open(override_config_path, 'r') as f:
-                override_config = json.load(f)
+            override_config = _load_json_file(override_config_path)
         except FileNotFoundError:
             # If the agent-specific config doesn't exist, return the base config
             return base_config
         except json.JSONDecodeError as e:
             raise ValueError(f"Malformed JSON in override configuration file: {override_config_path} - {e}")
 
-        merged_config = self._deep_merge(base_config, override_config)
+        merged_config = self._deep_merge(base_config, override_config, self._config_is_json)
         # Skip validation for agent configs since they don't need full schema compliance
         # self._validate_config(merged_config) # Validate the merged config
         return merged_config
@@ -141,33 +280,120 @@ class ConfigManager:
         """
         Retrieves the configuration for a specific agent by merging the agent's
         config.json with the base configuration.
-        Returns the merged configuration dictionary.
+        The merge is cached per agent until the base config changes; each call
+        returns a copy, so callers may modify it freely.
+        """
+        self._check_caches()
+        if agent_name not in self._agent_configs:
+            self._agent_configs[agent_name] = self._deep_merge(
+                self._config, self._get_agent_override(agent_name), self._config_is_json
+            )
+        return _clone_config(self._agent_configs[agent_name], self._config_is_json)
+
+    def get_agent(self, agent_name: str, key: str, default: Any = None) -> Any:
+        """
+        Retrieves a single value from an agent's effective configuration without
+        building the full merged dictionary.
+        The agent's config.json is consulted first, falling back to the base config.
+        Values taken from config.json are returned as copies, so the cached file stays intact.
+        """
+        value = self._get_agent_override(agent_name)
+        for k in _split_path(key):
+            if not isinstance(value, dict):
+                return default
+            if k not in value:
+                return self.get(key, default)
+            value = value[k]
+
+        # Parsed straight from config.json, so always safe to clone via orjson
+        value = _clone_config(value, True)
+        base_value = self.get(key)
+        if isinstance(value, dict) and isinstance(base_value, dict):
+            return self._deep_merge(base_value, value, self._config_is_json)
+        return value
+
+    def _get_agent_override(self, agent_name: str) -> Dict[str, Any]:
+        """
+        Loads and caches the raw contents of an agent's config.json.
+        Returns an empty dictionary if the agent has no config file.
+        """
+        self._check_caches()
+        if agent_name not in self._agent_overrides:
+            agent_dir = self._get_agent_paths().get(agent_name)
+            if agent_dir is None:
+                # Unknown agent, nothing to open
+                self._agent_overrides[agent_name] = {}
+                return self._agent_overrides[agent_name]
+            agent_config_path = os.path.join(agent_dir, "config.json")
+            try:
+                self._agent_overrides[agent_name] = _intern_keys(_load_json_file(agent_config_path))
+            except FileNotFoundError:
+                self._agent_overrides[agent_name] = {}
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Malformed JSON in override configuration file: {agent_config_path} - {e}")
+        return self._agent_overrides[agent_name]
+
+    def _get_agent_paths(self) -> Dict[str, str]:
+        """
+        Indexes agent directories by name on first use.
+        Only the directory listing is read; agent config files are opened on demand.
         """
-        agents_directory = self.get("agents.directory", "agents")
-        agent_config_path = Path(agents_directory) / agent_name / "config.json"
-        return self.get_merged_config(str(agent_config_path))
+        if self._agent_paths is None:
+            agents_directory = self.get("agents.directory", "agents")
+            try:
+                with os.scandir(agents_directory) as entries:
+                    self._agent_paths = {entry.name: entry.path for entry in entries if entry.is_dir()}
+            except (FileNotFoundError, NotADirectoryError):
+                self._agent_paths = {}
+        return self._agent_paths
+
+    def _clear_caches(self) -> None:
+        """Drops cached lookups and agent configs so they are rebuilt from the current base config."""
+        self._agent_paths = None
+        self._agent_overrides.clear()
+        self._agent_configs.clear()
+        self._cache_source = self._config
+
+    def _check_caches(self) -> None:
+        """Clears the caches if the base config dict was replaced without going through load_config."""
+        if self._cache_source is not self._config:
+            self._clear_caches()
+            # Nothing is known about a dict assigned directly, so stop treating it as parsed JSON
+            self._config_is_json = False
 
     @staticmethod
-    def _deep_merge(base: Dict, override: Dict) -> Dict:
+    def _deep_merge(base: Dict, override: Dict, base_is_json: bool = False) -> Dict:
         """
-        Recursively merges two dictionaries.
+        Merges two dictionaries, walking nested dicts with an explicit stack.
         `override` values take precedence over `base` values.
+        Only base subtrees that survive the merge are deep-copied; pass base_is_json=True
+        when `base` holds only parsed JSON so they can be copied via orjson.
         """
-        merged = copy.deepcopy(base)
-        for key, value in override.items():
-            if isinstance(value, dict) and key in merged and isinstance(merged[key], dict):
-                merged[key] = ConfigManager._deep_merge(merged[key], value)
-            else:
-                merged[key] = value
+        merged = {}
+        stack = [(merged, base, override)]
+        while stack:
+            target, base_node, override_node = stack.pop()
+            for key, base_value in base_node.items():
+                if key not in override_node:
+                    target[key] = _clone_config(base_value, base_is_json)
+                    continue
+                value = override_node[key]
+                if isinstance(value, dict) and isinstance(base_value, dict):
+                    target[key] = {}
+                    stack.append((target[key], base_value, value))
+                else:
+                    target[key] = value
+            for key, value in override_node.items():
+                if key not in base_node:
+                    target[key] = value
         return merged
 
     def _get_from_dict(self, config_dict: Dict, key: str, default: Any = None) -> Any:
         """
         Helper to retrieve a value from a specific dictionary.
         """
-        keys = key.split('.')
         value = config_dict
-        for k in keys:
+        for k in _split_path(key):
             if isinstance(value, dict) and k in value:
                 value = value[k]
             else:
@@ -186,11 +412,15 @@ class ConfigManager:
         Sets a value in the config.
         Can handle nested keys using dot notation (e.g., "agent.settings.model").
         """
-        keys = key.split('.')
+        self._check_caches()
+        keys = _split_path(key)
         d = self._config
         for k in keys[:-1]:
             d = d.setdefault(k, {})
         d[keys[-1]] = value
+        self._clear_caches()
+        if self._config_is_json and not _is_json_value(value):
+            self._config_is_json = False
 
 class AgentConfigManager:
     """
@@ -200,11 +430,13 @@ class AgentConfigManager:
         self._base_config_manager = base_config_manager
         self._agent_name = agent_name
         self._agent_config = None
+        self._agent_config_is_json = False
         
     def _get_agent_config(self):
         """Lazy-load the agent-specific configuration."""
         if self._agent_config is None:
             self._agent_config = self._base_config_manager.get_agent_config(self._agent_name)
+            self._agent_config_is_json = self._base_config_manager._config_is_json
         return self._agent_config
     
     def get(self, key: str, default: Any = None) -> Any:
@@ -219,7 +451,8 @@ class AgentConfigManager:
         """
         Returns a copy of the agent-specific merged configuration.
         """
-        return copy.deepcopy(self._get_agent_config())
+        agent_config = self._get_agent_config()
+        return _clone_config(agent_config, self._agent_config_is_json)
     
     def set(self, key: str, value: Any) -> None:
         """
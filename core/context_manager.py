@@ -1,4 +1,5 @@
-from typing import Any, Dict, List, Optional
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
 
 
 class ContextManager:
@@ -10,9 +11,23 @@ class ContextManager:
     to store context data and provides methods to get, set, and update context.
     """
 
-    def __init__(self):
-        """Initialize the ContextManager with an empty context dictionary."""
-        self._context: Dict[str, List[Any]] = {}
+    def __init__(self, max_history: Optional[int] = None):
+        """
+        Initialize the ContextManager with an empty context dictionary.
+
+        Args:
+            max_history (Optional[int]): Maximum number of values kept per key.
+                Older values are discarded once the limit is reached. None keeps everything.
+
+        Raises:
+            ValueError: If max_history is less than 1.
+        """
+        if max_history is not None and max_history < 1:
+            raise ValueError(f"max_history must be None or at least 1, got {max_history}")
+        self._max_history = max_history
+        self._context: Dict[str, Deque[Any]] = {}
+        # Most recent value per key, so get() is a single dict lookup
+        self._current: Dict[str, Any] = {}
 
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -25,9 +40,7 @@ class ContextManager:
         Returns:
             Any: The most recent value associated with the key, or default if key doesn't exist.
         """
-        if key in self._context and self._context[key]:
-            return self._context[key][-1]
-        return default
+        return self._current.get(key, default)
 
     def set(self, key: str, value: Any) -> None:
         """
@@ -37,7 +50,8 @@ class ContextManager:
             key (str): The key to set the value for.
             value (Any): The value to set.
         """
-        self._context[key] = [value]
+        self._context[key] = deque((value,), maxlen=self._max_history)
+        self._current[key] = value
 
     def add(self, key: str, value: Any) -> None:
         """
@@ -48,8 +62,9 @@ class ContextManager:
             value (Any): The value to add.
         """
         if key not in self._context:
-            self._context[key] = []
+            self._context[key] = deque(maxlen=self._max_history)
         self._context[key].append(value)
+        self._current[key] = value
 
     def get_history(self, key: str) -> List[Any]:
         """
@@ -61,7 +76,7 @@ class ContextManager:
         Returns:
             List[Any]: The complete list of values for the key, or empty list if key doesn't exist.
         """
-        return self._context.get(key, [])
+        return list(self._context.get(key, ()))
 
     def update(self, data: Dict[str, Any]) -> None:
         """
@@ -70,25 +85,27 @@ class ContextManager:
         Args:
             data (Dict[str, Any]): Dictionary of key-value pairs to update the context with.
         """
-        for key, value in data.items():
-            self.set(key, value)
+        maxlen = self._max_history
+        self._context.update({key: deque((value,), maxlen=maxlen) for key, value in data.items()})
+        self._current.update(data)
 
     def clear(self) -> None:
         """Clear all context data."""
         self._context.clear()
+        self._current.clear()
 
     def keys(self):
         """Return the keys in the context."""
-        return self._context.keys()
+        return self._current.keys()
 
     def items(self):
         """Return the key-value pairs in the context (most recent values only)."""
-        return {key: values[-1] if values else None for key, values in self._context.items()}.items()
+        return dict(self._current).items()
 
     def __contains__(self, key: str) -> bool:
         """Check if a key exists in the context."""
-        return key in self._context
+        return key in self._current
 
     def __len__(self) -> int:
         """Return the number of items in the context."""
-        return len(self._context)
\ No newline at end of file
+        return len(self._current)
\ No newline at end of file
@@ -0,0 +1,11 @@
+"""
+Shared pytest setup for the test suite.
+Puts the project root on sys.path once so test modules and the integration scripts can import
+core/ and agents/ without adjusting the path themselves.
+"""
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = str(Path(__file__).resolve().parents[1])
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
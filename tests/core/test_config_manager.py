@@ -2,121 +2,128 @@ import unittest
 import json
 import os
 import logging
+import math
+import shutil
+import tempfile
+from datetime import datetime
 from pathlib import Path
 from unittest.mock import patch, Mock
 from core.config_manager import ConfigManager, ConfigValidationError
 
+BASE_VALID_CONFIG = {
+    "project": {
+        "name": "TestProject",
+        "context": "A test project context.",
+        "tech_stack": "Python",
+        "architecture": "Modular",
+        "target_users": "Developers",
+        "constraints": "None"
+    },
+    "github": {
+        "repo_owner": "test_owner",
+        "repo_name": "test_repo",
+        "default_project": "TestBoard",
+        "default_labels": ["bug", "feature"]
+    },
+    "llm_settings": {
+        "default_provider": "gemini",
+        "output_format": "structured",
+        "research_depth": "standard",
+        "temperature": 0.7
+    },
+    "templates": {
+        "directories": ["templates"]
+    },
+    "automation": {
+        "auto_create_issues": True,
+        "auto_assign": False
+    },
+    "agent_execution_order": ["agent1", "agent2"]
+}
+
+OVERRIDE_CONFIG = {
+    "llm_settings": {
+        "default_provider": "openai",
+        "temperature": 0.9
+    },
+    "templates": {
+        "directories": ["custom_templates"]
+    }
+}
+
+INVALID_OVERRIDE_CONFIG = {
+    "llm_settings": {
+        "default_provider": 123 # Wrong type
+    }
+}
+
+AGENT_CONFIG = {
+    "llm_settings": {
+        "default_provider": "claude",
+        "temperature": 0.5
+    },
+    "agent_specific_setting": "test_value"
+}
+
+# (name, mutation applied to a copy of the valid config, expected error substring)
+INVALID_CASES = [
+    ('missing_field', lambda d: d['project'].pop('name'), "'name' is a required property"),
+    ('wrong_type', lambda d: d['llm_settings'].__setitem__('temperature', 'high'), "'high' is not of type 'number'"),
+    ('enum', lambda d: d['llm_settings'].__setitem__('default_provider', 'unsupported_llm'), "'unsupported_llm' is not one of"),
+]
+
 class TestConfigManager(unittest.TestCase):
 
-    def setUp(self):
-        # Reset the singleton instance before each test
-        ConfigManager._instance = None
-        # Initialize ConfigManager to load schema
-        self.config_manager = ConfigManager()
-        
-        self.test_dir = Path('tests/core/temp_test_configs')
-        os.makedirs(self.test_dir, exist_ok=True)
-
-        self.valid_config_path = self.test_dir / 'valid_config.json'
-        self.override_config_path = self.test_dir / 'override_config.json'
-        self.malformed_config_path = self.test_dir / 'malformed_config.json'
-        self.non_existent_config_path = self.test_dir / 'non_existent.json'
-        self.invalid_config_path = self.test_dir / 'invalid_config.json'
-        self.invalid_override_path = self.test_dir / 'invalid_override.json'
-        
+    @classmethod
+    def setUpClass(cls):
+        # The fixture files are read-only, so write them once per class
+        cls.test_dir = Path(tempfile.mkdtemp(prefix='test_configs_'))
+
+        cls.valid_config_path = cls.test_dir / 'valid_config.json'
+        cls.override_config_path = cls.test_dir / 'override_config.json'
+        cls.malformed_config_path = cls.test_dir / 'malformed_config.json'
+        cls.non_existent_config_path = cls.test_dir / 'non_existent.json'
+        cls.invalid_override_path = cls.test_dir / 'invalid_override.json'
+
         # Set up agent test directories and configs
-        self.agents_dir = self.test_dir / 'agents'
-        self.test_agent_dir = self.agents_dir / 'test_agent'
-        os.makedirs(self.test_agent_dir, exist_ok=True)
-        self.agent_config_path = self.test_agent_dir / 'config.json'
-
-
-        self.base_valid_config_data = {
-            "project": {
-                "name": "TestProject",
-                "context": "A test project context.",
-                "tech_stack": "Python",
-                "architecture": "Modular",
-                "target_users": "Developers",
-                "constraints": "None"
-            },
-            "github": {
-                "repo_owner": "test_owner",
-                "repo_name": "test_repo",
-                "default_project": "TestBoard",
-                "default_labels": ["bug", "feature"]
-            },
-            "llm_settings": {
-                "default_provider": "gemini",
-                "output_format": "structured",
-                "research_depth": "standard",
-                "temperature": 0.7
-            },
-            "templates": {
-                "directories": ["templates"]
-            },
-            "automation": {
-                "auto_create_issues": True,
-                "auto_assign": False
-            },
-            "agent_execution_order": ["agent1", "agent2"],
-            "agents": {
-                "directory": str(self.agents_dir)
-            }
-        }
-        
-        self.override_config_data = {
-            "llm_settings": {
-                "default_provider": "openai",
-                "temperature": 0.9
-            },
-            "templates": {
-                "directories": ["custom_templates"]
-            }
+        cls.agents_dir = cls.test_dir / 'agents'
+        cls.test_agent_dir = cls.agents_dir / 'test_agent'
+        os.makedirs(cls.test_agent_dir)
+        cls.agent_config_path = cls.test_agent_dir / 'config.json'
+
+        # Shared read-only fixtures; tests that mutate them take a deep copy first
+        cls.base_valid_config_data = dict(BASE_VALID_CONFIG, agents={"directory": str(cls.agents_dir)})
+        cls.override_config_data = OVERRIDE_CONFIG
+        # Parsing this template is cheaper than deep-copying the base config in each test
+        cls._base_bytes = json.dumps(cls.base_valid_config_data).encode()
+
+        fixtures = {
+            cls.valid_config_path: cls.base_valid_config_data,
+            cls.override_config_path: OVERRIDE_CONFIG,
+            # Would make the merged config invalid
+            cls.invalid_override_path: INVALID_OVERRIDE_CONFIG,
+            cls.agent_config_path: AGENT_CONFIG,
         }
+        for path, data in fixtures.items():
+            path.write_bytes(json.dumps(data).encode())
+        cls.malformed_config_path.write_bytes(b'{"key": "value",}')
 
-        with open(self.valid_config_path, 'w') as f:
-            json.dump(self.base_valid_config_data, f)
-            
-        with open(self.override_config_path, 'w') as f:
-            json.dump(self.override_config_data, f)
+    @classmethod
+    def fresh_base_config(cls):
+        """Returns a mutable copy of the base valid config."""
+        return json.loads(cls._base_bytes)
 
-        with open(self.malformed_config_path, 'w') as f:
-            f.write('{"key": "value",}')
-        
-        # Create an invalid config file for testing validation errors
-        import copy
-        invalid_data = copy.deepcopy(self.base_valid_config_data)
-        invalid_data['llm_settings']['default_provider'] = 'unsupported_llm' # Invalid enum value
-        with open(self.invalid_config_path, 'w') as f:
-            json.dump(invalid_data, f)
-
-        # Create an invalid override config that would make the merged config invalid
-        invalid_override_data = {
-            "llm_settings": {
-                "default_provider": 123 # Wrong type
-            }
-        }
-        with open(self.invalid_override_path, 'w') as f:
-            json.dump(invalid_override_data, f)
-            
-        # Create agent config for testing
-        self.agent_config_data = {
-            "llm_settings": {
-                "default_provider": "claude",
-                "temperature": 0.5
-            },
-            "agent_specific_setting": "test_value"
-        }
-        with open(self.agent_config_path, 'w') as f:
-            json.dump(self.agent_config_data, f)
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.test_dir, ignore_errors=True)
 
+    def setUp(self):
+        # Reset the singleton instance before each test
+        ConfigManager._instance = None
+        # Initialize ConfigManager to load schema
+        self.config_manager = ConfigManager()
 
     def tearDown(self):
-        # Clean up created files and directories
-        import shutil
-        if self.test_dir.exists():
-            shutil.rmtree(self.test_dir)
         # Reset singleton after tests
         ConfigManager._instance = None
 
@@ -126,6 +133,15 @@ class TestConfigManager(unittest.TestCase):
         instance2 = ConfigManager()
         self.assertIs(instance1, instance2)
 
+    def test_new_instance_is_isolated_from_singleton(self):
+        singleton = ConfigManager()
+        isolated = ConfigManager._new_instance()
+        self.assertIsNot(isolated, singleton)
+        self.assertIs(ConfigManager(), singleton)
+        isolated.load_config(self.valid_config_path)
+        self.assertEqual(isolated.get("project.name"), "TestProject")
+        self.assertIsNone(singleton.get("project.name"))
+
     def test_load_config_success(self):
         self.config_manager.load_config(str(self.valid_config_path))
         self.assertEqual(self.config_manager.get_config(), self.base_valid_config_data)
@@ -139,51 +155,93 @@ class TestConfigManager(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.config_manager.load_config(str(self.malformed_config_path))
 
-    def test_load_config_invalid_schema_missing_field(self):
-        # Create a config missing a required field
-        invalid_data = self.base_valid_config_data.copy()
-        del invalid_data['project']['name']
-        with open(self.invalid_config_path, 'w') as f:
-            json.dump(invalid_data, f)
-        
-        with self.assertRaises(ConfigValidationError) as cm:
-            self.config_manager.load_config(str(self.invalid_config_path))
-        self.assertIn("'name' is a required property", str(cm.exception))
-
-    def test_load_config_invalid_schema_wrong_type(self):
-        # Create a config with wrong type
-        invalid_data = self.base_valid_config_data.copy()
-        invalid_data['llm_settings']['temperature'] = "high" # Should be number
-        with open(self.invalid_config_path, 'w') as f:
-            json.dump(invalid_data, f)
-        
-        with self.assertRaises(ConfigValidationError) as cm:
-            self.config_manager.load_config(str(self.invalid_config_path))
-        self.assertIn("'high' is not of type 'number'", str(cm.exception))
+    def test_load_config_accepts_non_finite_literals(self):
+        # The stdlib parser accepts NaN and Infinity, so orjson rejecting them must not matter
+        config = self.fresh_base_config()
+        config['llm_settings']['temperature'] = float('nan')
+        config['limits'] = {'max_cost': float('inf')}
+        path = self.test_dir / 'non_finite_config.json'
+        path.write_text(json.dumps(config))
+
+        self.config_manager.load_config(path, validate=False)
+        self.assertTrue(math.isnan(self.config_manager.get('llm_settings.temperature')))
+        self.assertEqual(self.config_manager.get('limits.max_cost'), float('inf'))
+
+    def test_load_config_invalid_schemas(self):
+        for name, mutate, expected in INVALID_CASES:
+            with self.subTest(name=name):
+                invalid_data = self.fresh_base_config()
+                mutate(invalid_data)
+                # Write to a per-case path so the shared fixtures stay untouched
+                invalid_path = self.test_dir / f'invalid_{name}.json'
+                with open(invalid_path, 'w') as f:
+                    json.dump(invalid_data, f)
+
+                with self.assertRaises(ConfigValidationError) as cm:
+                    self.config_manager.load_config(str(invalid_path))
+                self.assertIn(expected, str(cm.exception))
+
+    def test_load_config_reuses_unchanged_file(self):
+        with patch.object(self.config_manager, '_validate_config', wraps=self.config_manager._validate_config) as mock_validate:
+            self.config_manager.load_config(str(self.valid_config_path))
+            self.config_manager.set("project.name", "Changed in memory")
+            self.config_manager.load_config(str(self.valid_config_path))
+            self.assertEqual(mock_validate.call_count, 1)
+
+        # The reload starts from the file contents, not the in-memory edits
+        self.assertEqual(self.config_manager.get_config(), self.base_valid_config_data)
 
-    def test_load_config_invalid_schema_enum_value(self):
-        # Use the pre-created invalid_config_path with unsupported_llm
-        with self.assertRaises(ConfigValidationError) as cm:
-            self.config_manager.load_config(str(self.invalid_config_path))
-        self.assertIn("'unsupported_llm' is not one of ['gemini', 'openai', 'claude']", str(cm.exception))
+    def test_load_config_revalidates_changed_file(self):
+        config_path = self.test_dir / 'changing_config.json'
+        config_path.write_text(json.dumps(self.base_valid_config_data))
+        self.config_manager.load_config(str(config_path))
 
-    def test_get_top_level_key(self):
-        self.config_manager.load_config(str(self.valid_config_path))
-        self.assertEqual(self.config_manager.get("project.name"), "TestProject")
+        invalid_data = self.fresh_base_config()
+        invalid_data['llm_settings']['temperature'] = "high"
+        config_path.write_text(json.dumps(invalid_data))
+        with self.assertRaises(ConfigValidationError):
+            self.config_manager.load_config(str(config_path))
 
-    def test_get_nested_key(self):
+    def test_load_config_without_validation(self):
+        invalid_data = self.fresh_base_config()
+        invalid_data['llm_settings']['temperature'] = "high"
+        config_path = self.test_dir / 'trusted_config.json'
+        config_path.write_text(json.dumps(invalid_data))
+
+        self.config_manager.load_config(str(config_path), validate=False)
+        self.assertEqual(self.config_manager.get("llm_settings.temperature"), "high")
+
+    def test_get_keys(self):
         self.config_manager.load_config(str(self.valid_config_path))
-        self.assertEqual(self.config_manager.get("llm_settings.default_provider"), "gemini")
+        cases = [
+            ("top_level", "project.name", None, "TestProject"),
+            ("nested", "llm_settings.default_provider", None, "gemini"),
+            ("non_existent", "non.existent.key", None, None),
+            ("default_value", "non.existent.key", "default", "default"),
+        ]
+        for name, key, default, expected in cases:
+            with self.subTest(name=name):
+                self.assertEqual(self.config_manager.get(key, default=default), expected)
         self.assertEqual(self.config_manager.get("github.default_labels")[0], "bug")
 
-    def test_get_non_existent_key(self):
+    def test_get_reflects_set(self):
         self.config_manager.load_config(str(self.valid_config_path))
-        self.assertIsNone(self.config_manager.get("non.existent.key"))
+        self.assertIsNone(self.config_manager.get("project.owner"))
+        self.assertEqual(self.config_manager.get("project.owner", "nobody"), "nobody")
 
-    def test_get_key_with_default_value(self):
+        self.config_manager.set("project.owner", "alice")
+        self.assertEqual(self.config_manager.get("project.owner"), "alice")
+
+        self.config_manager.load_config(str(self.non_existent_config_path))
+        self.assertIsNone(self.config_manager.get("project.owner"))
+
+    def test_get_sees_in_place_changes(self):
         self.config_manager.load_config(str(self.valid_config_path))
-        default_value = "default"
-        self.assertEqual(self.config_manager.get("non.existent.key", default=default_value), default_value)
+        self.assertEqual(self.config_manager.get("project.owner", "nobody"), "nobody")
+
+        # get() hands out live sub-dicts, so edits made through them must be visible
+        self.config_manager.get("project")["owner"] = "alice"
+        self.assertEqual(self.config_manager.get("project.owner", "nobody"), "alice")
 
     def test_deep_merge(self):
         merged = ConfigManager._deep_merge(self.base_valid_config_data, self.override_config_data)
@@ -198,12 +256,50 @@ class TestConfigManager(unittest.TestCase):
         self.assertEqual(merged['github']['repo_owner'], 'test_owner')
         self.assertEqual(merged['automation']['auto_create_issues'], True)
 
+    def test_deep_merge_nested_levels_do_not_alias_base(self):
+        base = {"a": {"b": {"c": 1, "d": [1, 2]}, "e": {"f": 2}}}
+        override = {"a": {"b": {"c": 10}}}
+        merged = ConfigManager._deep_merge(base, override)
+
+        self.assertEqual(merged, {"a": {"b": {"c": 10, "d": [1, 2]}, "e": {"f": 2}}})
+
+        # Mutating the result must not leak back into the base
+        merged["a"]["b"]["d"].append(3)
+        merged["a"]["e"]["f"] = 20
+        self.assertEqual(base, {"a": {"b": {"c": 1, "d": [1, 2]}, "e": {"f": 2}}})
+
+    def test_get_config_returns_independent_copy(self):
+        self.config_manager.load_config(str(self.valid_config_path))
+        config = self.config_manager.get_config()
+        config['github']['default_labels'].append('docs')
+        self.assertEqual(self.config_manager.get("github.default_labels"), ["bug", "feature"])
+
+        # Storing a non-JSON value takes the config off the orjson path, so copies use deepcopy
+        self.assertTrue(self.config_manager._config_is_json)
+        self.config_manager.set("runtime.marker", {1: object()})
+        self.assertFalse(self.config_manager._config_is_json)
+        self.assertIn(1, self.config_manager.get_config()["runtime"]["marker"])
+
+    def test_get_config_keeps_non_json_types(self):
+        self.config_manager.load_config(str(self.valid_config_path))
+        when = datetime(2024, 1, 2, 3, 4, 5)
+        self.config_manager.set("runtime", {"when": when, "span": (1, 2)})
+
+        # Copies must not go through a JSON round-trip once set() stores non-JSON values
+        copies = {
+            "get_config": self.config_manager.get_config(),
+            "get_agent_config": self.config_manager.get_agent_config("test_agent"),
+        }
+        for name, config in copies.items():
+            with self.subTest(name=name):
+                self.assertEqual(config["runtime"], {"when": when, "span": (1, 2)})
+                self.assertIsInstance(config["runtime"]["span"], tuple)
+
     def test_get_merged_config_success(self):
         self.config_manager.load_config(str(self.valid_config_path))
         merged_config = self.config_manager.get_merged_config(str(self.override_config_path))
         
-        import copy
-        expected_merged = copy.deepcopy(self.base_valid_config_data)
+        expected_merged = self.fresh_base_config()
         expected_merged['llm_settings']['default_provider'] = 'openai'
         expected_merged['llm_settings']['temperature'] = 0.9
         expected_merged['templates']['directories'] = ['custom_templates']
@@ -258,8 +354,7 @@ class TestConfigManager(unittest.TestCase):
 
     def test_get_agent_config_defaults_to_agents_directory(self):
         # Test with a config that doesn't specify agents.directory
-        import copy
-        config_without_agents_dir = copy.deepcopy(self.base_valid_config_data)
+        config_without_agents_dir = self.fresh_base_config()
         del config_without_agents_dir['agents']
         
         config_path_no_agents_dir = self.test_dir / 'config_no_agents_dir.json'
@@ -277,6 +372,45 @@ class TestConfigManager(unittest.TestCase):
         expected_config = test_config_manager.get_config()
         self.assertEqual(agent_config, expected_config)
 
+    def test_get_agent_resolves_single_keys(self):
+        self.config_manager.load_config(str(self.valid_config_path))
+
+        # Agent override wins, base config fills the gaps
+        self.assertEqual(self.config_manager.get_agent('test_agent', 'llm_settings.default_provider'), 'claude')
+        self.assertEqual(self.config_manager.get_agent('test_agent', 'agent_specific_setting'), 'test_value')
+        self.assertEqual(self.config_manager.get_agent('test_agent', 'llm_settings.output_format'), 'structured')
+        self.assertEqual(self.config_manager.get_agent('test_agent', 'project.name'), 'TestProject')
+        self.assertEqual(self.config_manager.get_agent('test_agent', 'missing.key', 'default'), 'default')
+
+        # Partially overridden sections match the merged view
+        self.assertEqual(
+            self.config_manager.get_agent('test_agent', 'llm_settings'),
+            self.config_manager.get_agent_config('test_agent')['llm_settings']
+        )
+
+    def test_get_agent_config_cached_until_base_config_changes(self):
+        self.config_manager.load_config(str(self.valid_config_path))
+        self.config_manager.get_agent_config('test_agent')
+        merged = self.config_manager._agent_configs['test_agent']
+        self.config_manager.get_agent_config('test_agent')
+        self.assertIs(self.config_manager._agent_configs['test_agent'], merged)
+
+        self.config_manager.set('project.name', 'Renamed')
+        refreshed = self.config_manager.get_agent_config('test_agent')
+        self.assertIsNot(self.config_manager._agent_configs['test_agent'], merged)
+        self.assertEqual(refreshed['project']['name'], 'Renamed')
+
+    def test_agent_lookups_return_copies(self):
+        self.config_manager.load_config(str(self.valid_config_path))
+
+        # Filling in defaults on a returned dict must not leak into later lookups
+        self.config_manager.get_agent_config('test_agent')['llm_settings']['temperature'] = 0.1
+        self.config_manager.get_agent('test_agent', 'llm_settings')['default_provider'] = 'openai'
+
+        self.assertEqual(self.config_manager.get_agent_config('test_agent')['llm_settings']['temperature'], 0.5)
+        self.assertEqual(self.config_manager.get_agent('test_agent', 'llm_settings.default_provider'), 'claude')
+        self.assertEqual(self.config_manager.get_agent('test_agent', 'llm_settings.temperature'), 0.5)
+
     def test_get_agent_execution_order(self):
         self.config_manager.load_config(str(self.valid_config_path))
         execution_order = self.config_manager.get_agent_execution_order()
@@ -287,51 +421,8 @@ class TestConfigManager(unittest.TestCase):
         execution_order = self.config_manager.get_agent_execution_order()
         self.assertEqual(execution_order, [])
     
-    def test_configure_logging_with_valid_log_level(self):
-        """Test logging configuration with valid log level."""
-        # Reset singleton and logging configured flag
-        ConfigManager._instance = None
-        config_data = self.base_valid_config_data.copy()
-        config_data['log_level'] = 'debug'
-        
-        config_path = self.test_dir / 'config_with_log_level.json'
-        with open(config_path, 'w') as f:
-            json.dump(config_data, f)
-        
-        with patch('logging.basicConfig') as mock_basic_config:
-            config_manager = ConfigManager()
-            config_manager.load_config(str(config_path))
-            
-            # Verify basicConfig was called with DEBUG level
-            mock_basic_config.assert_called_with(
-                level=logging.DEBUG,
-                format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-                force=True
-            )
-    
-    def test_configure_logging_with_invalid_log_level(self):
-        """Test logging configuration falls back gracefully with invalid log level."""
-        # Reset singleton and logging configured flag
-        ConfigManager._instance = None
-        config_data = self.base_valid_config_data.copy()
-        config_data['log_level'] = 'invalid_level'
-        
-        config_path = self.test_dir / 'config_with_invalid_log_level.json'
-        with open(config_path, 'w') as f:
-            json.dump(config_data, f)
-        
-        # This should raise a ConfigValidationError due to schema validation
-        config_manager = ConfigManager()
-        with self.assertRaises(ConfigValidationError) as cm:
-            config_manager.load_config(str(config_path))
-        
-        # Verify the error message contains the validation error
-        self.assertIn("'invalid_level' is not one of", str(cm.exception))
-    
     def test_configure_logging_with_agent_specific_levels(self):
         """Test logging configuration with agent-specific log levels."""
-        # Reset singleton and logging configured flag
-        ConfigManager._instance = None
         config_data = self.base_valid_config_data.copy()
         config_data['log_level'] = 'info'
         config_data['agents'] = {
@@ -357,43 +448,15 @@ class TestConfigManager(unittest.TestCase):
                     'agents.another_agent': mock_logger2
                 }.get(name, Mock())
                 
-                config_manager = ConfigManager()
-                config_manager.load_config(str(config_path))
+                self.config_manager.load_config(str(config_path))
                 
                 # Verify agent loggers were configured with specific levels
                 mock_logger1.setLevel.assert_called_with(logging.DEBUG)
                 mock_logger2.setLevel.assert_called_with(logging.ERROR)
     
-    def test_configure_logging_with_agent_invalid_log_level(self):
-        """Test agent-specific logging with invalid log level fails schema validation."""
-        # Reset singleton and logging configured flag
-        ConfigManager._instance = None
-        config_data = self.base_valid_config_data.copy()
-        config_data['log_level'] = 'info'
-        config_data['agents'] = {
-            'directory': str(self.agents_dir),
-            'test_agent': {
-                'log_level': 'invalid'
-            }
-        }
-        
-        config_path = self.test_dir / 'config_with_invalid_agent_log_level.json'
-        with open(config_path, 'w') as f:
-            json.dump(config_data, f)
-        
-        # This should raise a ConfigValidationError due to schema validation
-        config_manager = ConfigManager()
-        with self.assertRaises(ConfigValidationError) as cm:
-            config_manager.load_config(str(config_path))
-        
-        # Verify the error message contains the validation error
-        self.assertIn("'invalid' is not one of", str(cm.exception))
-    
     def test_configure_logging_called_only_once(self):
         """Test that logging configuration is called only once."""
-        # Reset singleton
-        ConfigManager._instance = None
-        config_manager = ConfigManager()
+        config_manager = self.config_manager
         
         with patch('logging.basicConfig') as mock_basic_config:
             # First call should configure logging
@@ -407,21 +470,50 @@ class TestConfigManager(unittest.TestCase):
             config_manager.configure_logging()
             self.assertFalse(mock_basic_config.called)
     
-    def test_configure_logging_without_log_level_config(self):
-        """Test logging configuration with default log level when not specified in config."""
-        # Reset singleton
-        ConfigManager._instance = None
-        
+    def test_configure_logging_global_levels(self):
+        """Test basicConfig receives the configured global level, defaulting to INFO."""
+        cases = [
+            ('debug', logging.DEBUG),
+            ('error', logging.ERROR),
+            (None, logging.INFO),  # Config without log_level
+        ]
         with patch('logging.basicConfig') as mock_basic_config:
-            config_manager = ConfigManager()
-            config_manager.load_config(str(self.valid_config_path))  # Config without log_level
-            
-            # Should use default INFO level
-            mock_basic_config.assert_called_with(
-                level=logging.INFO,
-                format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-                force=True
-            )
+            for log_level, expected_level in cases:
+                with self.subTest(log_level=log_level):
+                    config_data = self.base_valid_config_data.copy()
+                    if log_level is not None:
+                        config_data['log_level'] = log_level
+                    # A path per case, so load_config's (mtime, size) cache never sees a stale file
+                    config_path = self.test_dir / f'config_log_level_{log_level}.json'
+                    config_path.write_text(json.dumps(config_data))
+
+                    self.config_manager._logging_configured = False
+                    self.config_manager.load_config(str(config_path))
+
+                    mock_basic_config.assert_called_with(
+                        level=expected_level,
+                        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+                        force=True
+                    )
+
+    def test_configure_logging_rejects_invalid_levels(self):
+        """Test invalid global and agent-specific log levels fail schema validation."""
+        cases = [
+            ('global', {'log_level': 'invalid_level'}, "'invalid_level' is not one of"),
+            ('agent', {
+                'log_level': 'info',
+                'agents': {'directory': str(self.agents_dir), 'test_agent': {'log_level': 'invalid'}}
+            }, "'invalid' is not one of"),
+        ]
+        for name, overrides, expected in cases:
+            with self.subTest(name=name):
+                config_data = dict(self.base_valid_config_data, **overrides)
+                config_path = self.test_dir / f'config_invalid_{name}_log_level.json'
+                config_path.write_text(json.dumps(config_data))
+
+                with self.assertRaises(ConfigValidationError) as cm:
+                    self.config_manager.load_config(str(config_path))
+                self.assertIn(expected, str(cm.exception))
 
 
 if __name__ == '__main__':
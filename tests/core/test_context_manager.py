@@ -27,6 +27,22 @@ class TestContextManager(unittest.TestCase):
         self.assertEqual(self.context_manager.get('key1'), 'value3')
         self.assertEqual(self.context_manager.get_history('key1'), ['value1', 'value2', 'value3'])
 
+    def test_max_history_bounds_growth(self):
+        """Test that max_history discards the oldest values for a key."""
+        context_manager = ContextManager(max_history=2)
+        for value in ('value1', 'value2', 'value3'):
+            context_manager.add('key1', value)
+
+        self.assertEqual(context_manager.get('key1'), 'value3')
+        self.assertEqual(context_manager.get_history('key1'), ['value2', 'value3'])
+
+    def test_max_history_must_be_positive(self):
+        """Test that max_history below 1 is rejected up front."""
+        for max_history in (0, -1):
+            with self.subTest(max_history=max_history):
+                with self.assertRaises(ValueError):
+                    ContextManager(max_history=max_history)
+
     def test_get_nonexistent_key(self):
         """Test getting a value for a key that doesn't exist."""
         self.assertIsNone(self.context_manager.get('nonexistent'))
@@ -2,35 +2,69 @@ import unittest
 from unittest.mock import Mock, patch, MagicMock
 import os
 import sys
+from types import SimpleNamespace
 
-# Add the project root to the path so we can import our modules
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+from core.llm_manager import LLMManager
+from tests.stubs import StubConfigManager
 
-# Mock google.generativeai before importing LLMManager
-with patch.dict('sys.modules', {'google.generativeai': MagicMock()}):
-    from core.llm_manager import LLMManager
-    from core.config_manager import ConfigManager
+# One fake google.generativeai for the whole module; LLMManager imports it lazily at call time.
+# A fake parent 'google' lets that import resolve when the SDK is not installed.
+_FAKE_GENAI = MagicMock()
+_saved_modules = {}
+
+def setUpModule():
+    global _FAKE_GENAI
+    # Reuse a fake another test module already installed so both patch the same object
+    installed = sys.modules.get('google.generativeai')
+    if isinstance(installed, MagicMock):
+        _FAKE_GENAI = installed
+    fakes = {
+        'google': MagicMock(generativeai=_FAKE_GENAI),
+        'google.generativeai': _FAKE_GENAI,
+    }
+    # Touch only these two entries, so modules first imported during the tests stay registered
+    for name, module in fakes.items():
+        _saved_modules[name] = sys.modules.get(name)
+        sys.modules[name] = module
+
+def tearDownModule():
+    for name, module in _saved_modules.items():
+        if module is None:
+            sys.modules.pop(name, None)
+        else:
+            sys.modules[name] = module
+    _saved_modules.clear()
+
+_CONFIG_VALUES = {
+    "llm_settings.default_provider": "gemini",
+    "llm_settings.model": "gemini-2.0-flash-exp",
+    "llm_settings.temperature": 0.7,
+    "llm_settings.max_tokens": 8192,
+    "llm_settings.top_p": 0.8,
+    "llm_settings.top_k": 40,
+}
+
+# Gemini responses are only read for .text
+_CANNED_RESPONSE = SimpleNamespace(text="Test response")
 
 class TestLLMManager(unittest.TestCase):
     
+    @classmethod
+    def setUpClass(cls):
+        """Build the config stub and the manager under test once for the class."""
+        cls.mock_config_manager = StubConfigManager(_CONFIG_VALUES)
+        cls.llm_manager = LLMManager(cls.mock_config_manager)
+    
     def setUp(self):
-        """Set up test fixtures before each test method."""
-        self.mock_config_manager = Mock(spec=ConfigManager)
-        self.mock_config_manager.get.side_effect = self._mock_config_get
+        """Reset the shared stub and genai fake before each test method."""
+        self.mock_config_manager.get_agent_config.reset_mock(return_value=True, side_effect=True)
         self.mock_config_manager.get_agent_config.return_value = {}
+        _FAKE_GENAI.reset_mock(return_value=True, side_effect=True)
+        self.fake_genai = _FAKE_GENAI
+        self.fake_model = Mock()
+        self.fake_model.generate_content.return_value = _CANNED_RESPONSE
+        self.fake_genai.GenerativeModel.return_value = self.fake_model
         
-    def _mock_config_get(self, key, default=None):
-        """Mock config values for testing."""
-        config_values = {
-            "llm_settings.default_provider": "gemini",
-            "llm_settings.model": "gemini-2.0-flash-exp",
-            "llm_settings.temperature": 0.7,
-            "llm_settings.max_tokens": 8192,
-            "llm_settings.top_p": 0.8,
-            "llm_settings.top_k": 40,
-        }
-        return config_values.get(key, default)
-    
     def test_llm_manager_initialization(self):
         """Test that LLMManager can be initialized with a ConfigManager."""
         llm_manager = LLMManager(self.mock_config_manager)
@@ -38,7 +72,7 @@ class TestLLMManager(unittest.TestCase):
     
     def test_execute_empty_prompt(self):
         """Test that empty prompt raises ValueError."""
-        llm_manager = LLMManager(self.mock_config_manager)
+        llm_manager = self.llm_manager
         
         with self.assertRaises(ValueError) as context:
             llm_manager.execute("")
@@ -47,7 +81,7 @@ class TestLLMManager(unittest.TestCase):
     
     def test_execute_none_prompt(self):
         """Test that None prompt raises ValueError."""
-        llm_manager = LLMManager(self.mock_config_manager)
+        llm_manager = self.llm_manager
         
         with self.assertRaises(ValueError) as context:
             llm_manager.execute(None)
@@ -55,27 +89,19 @@ class TestLLMManager(unittest.TestCase):
         self.assertIn("Prompt cannot be empty", str(context.exception))
     
     @patch.dict(os.environ, {'GEMINI_API_KEY': 'test_api_key'})
-    @patch('google.generativeai', new_callable=MagicMock)
-    def test_execute_gemini_success(self, mock_genai):
+    def test_execute_gemini_success(self):
         """Test successful Gemini API call execution."""
-        # Set up mock response
-        mock_model = Mock()
-        mock_response = Mock()
-        mock_response.text = "Test response"
-        mock_model.generate_content.return_value = mock_response
-        mock_genai.GenerativeModel.return_value = mock_model
-        
-        llm_manager = LLMManager(self.mock_config_manager)
+        llm_manager = self.llm_manager
         result = llm_manager.execute("Test prompt")
         
         self.assertEqual(result, "Test response")
-        mock_genai.configure.assert_called_once_with(api_key='test_api_key')
-        mock_genai.GenerativeModel.assert_called_once_with('gemini-2.0-flash-exp')
-        mock_model.generate_content.assert_called_once()
+        self.fake_genai.configure.assert_called_once_with(api_key='test_api_key')
+        self.fake_genai.GenerativeModel.assert_called_once_with('gemini-2.0-flash-exp')
+        self.fake_model.generate_content.assert_called_once()
     
     def test_execute_unsupported_provider(self):
         """Test that unsupported provider raises ValueError."""
-        llm_manager = LLMManager(self.mock_config_manager)
+        llm_manager = self.llm_manager
         
         with self.assertRaises(ValueError) as context:
             llm_manager.execute("Test prompt", provider="unsupported")
@@ -85,7 +111,7 @@ class TestLLMManager(unittest.TestCase):
     @patch.dict(os.environ, {}, clear=True)
     def test_execute_no_api_key(self):
         """Test that missing API key raises ValueError."""
-        llm_manager = LLMManager(self.mock_config_manager)
+        llm_manager = self.llm_manager
         
         with self.assertRaises(ValueError) as context:
             llm_manager.execute("Test prompt")
@@ -93,26 +119,25 @@ class TestLLMManager(unittest.TestCase):
         self.assertIn("GEMINI_API_KEY environment variable not set", str(context.exception))
     
     @patch.dict(os.environ, {'GEMINI_API_KEY': 'test_api_key'})
-    @patch('google.generativeai', new_callable=MagicMock)
-    def test_execute_with_custom_temperature(self, mock_genai):
+    def test_execute_with_custom_temperature(self):
         """Test execute with custom temperature parameter."""
-        mock_model = Mock()
-        mock_response = Mock()
-        mock_response.text = "Test response"
-        mock_model.generate_content.return_value = mock_response
-        mock_genai.GenerativeModel.return_value = mock_model
+        captured = []
+        def _generate_content(prompt, **kwargs):
+            captured.append(kwargs)
+            return _CANNED_RESPONSE
+        self.fake_model.generate_content = _generate_content
         
-        llm_manager = LLMManager(self.mock_config_manager)
+        llm_manager = self.llm_manager
         result = llm_manager.execute("Test prompt", temperature=0.5)
         
-        # Verify the generation config includes custom temperature
-        call_args = mock_model.generate_content.call_args
-        generation_config = call_args[1]['generation_config']
-        self.assertEqual(generation_config['temperature'], 0.5)
+        # Verify the response text is returned and the generation config includes custom temperature
+        self.assertEqual(result, "Test response")
+        self.assertEqual(len(captured), 1)
+        self.assertEqual(captured[0]['generation_config']['temperature'], 0.5)
     
     def test_resolve_configuration_defaults(self):
         """Test configuration resolution with defaults."""
-        llm_manager = LLMManager(self.mock_config_manager)
+        llm_manager = self.llm_manager
         config = llm_manager._resolve_configuration()
         
         expected_config = {
@@ -127,7 +152,7 @@ class TestLLMManager(unittest.TestCase):
     
     def test_resolve_configuration_with_overrides(self):
         """Test configuration resolution with parameter overrides."""
-        llm_manager = LLMManager(self.mock_config_manager)
+        llm_manager = self.llm_manager
         config = llm_manager._resolve_configuration(
             provider="gemini",
             temperature=0.9,
@@ -138,28 +163,27 @@ class TestLLMManager(unittest.TestCase):
         self.assertEqual(config['custom_param'], "value")
     
     @patch.dict(os.environ, {'GEMINI_API_KEY': 'test_api_key'})
-    @patch('google.generativeai', new_callable=MagicMock)
-    def test_validate_gemini_availability_success(self, mock_genai):
+    def test_validate_gemini_availability_success(self):
         """Test successful Gemini availability validation."""
-        mock_genai.list_models.return_value = [Mock()]
+        self.fake_genai.list_models.return_value = [Mock()]
         
-        llm_manager = LLMManager(self.mock_config_manager)
+        llm_manager = self.llm_manager
         available = llm_manager._validate_gemini_availability()
         
         self.assertTrue(available)
-        mock_genai.configure.assert_called_once_with(api_key='test_api_key')
+        self.fake_genai.configure.assert_called_once_with(api_key='test_api_key')
     
     @patch.dict(os.environ, {}, clear=True)
     def test_validate_gemini_availability_no_key(self):
         """Test Gemini availability validation without API key."""
-        llm_manager = LLMManager(self.mock_config_manager)
+        llm_manager = self.llm_manager
         available = llm_manager._validate_gemini_availability()
         
         self.assertFalse(available)
     
     def test_get_available_providers(self):
         """Test getting available providers."""
-        llm_manager = LLMManager(self.mock_config_manager)
+        llm_manager = self.llm_manager
         
         with patch.object(llm_manager, '_validate_gemini_availability', return_value=True):
             providers = llm_manager.get_available_providers()
@@ -168,7 +192,7 @@ class TestLLMManager(unittest.TestCase):
     
     def test_validate_config(self):
         """Test configuration validation."""
-        llm_manager = LLMManager(self.mock_config_manager)
+        llm_manager = self.llm_manager
         
         with patch.object(llm_manager, 'get_available_providers', return_value={"gemini": True}):
             config = llm_manager.validate_config()
@@ -1,7 +1,9 @@
 import unittest
 import json
 import os
+import py_compile
 import shutil
+import tempfile
 from core.config_manager import ConfigManager
 from agents.orchestrator import AgentOrchestrator
 from agents.base_agent import BaseAgent
@@ -20,27 +22,35 @@ class MockAgent(BaseAgent):
 
 class TestAgentOrchestrator(unittest.TestCase):
 
-    def setUp(self):
-        self.test_dir = 'tests/core/temp_test_agents'
-        self.agents_dir = os.path.join(self.test_dir, 'agents')
-        os.makedirs(self.agents_dir, exist_ok=True)
+    @classmethod
+    def setUpClass(cls):
+        """Lay out the mock agent tree once; the agents are read-only fixtures."""
+        cls.test_dir = tempfile.mkdtemp(prefix='temp_test_agents_')
+        cls.agents_dir = os.path.join(cls.test_dir, 'agents')
+        os.makedirs(cls.agents_dir, exist_ok=True)
 
         # Create mock agents
-        self.create_mock_agent('agent_a', 'AgentA')
-        self.create_mock_agent('agent_b', 'AgentB')
-        self.create_mock_agent('agent_c', 'AgentC')
+        cls.create_mock_agent('agent_a', 'AgentA')
+        cls.create_mock_agent('agent_b', 'AgentB')
+        cls.create_mock_agent('agent_c', 'AgentC')
+
+        cls._base_config = {"agents": {"directory": cls.agents_dir}}
 
-        # Config Manager
-        ConfigManager._instance = None
-        self.config_manager = ConfigManager()
-        self.config_path = os.path.join(self.test_dir, 'config.json')
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.test_dir)
+
+    def setUp(self):
+        # Inject an isolated Config Manager rather than resetting the singleton
+        self.config_manager = ConfigManager._new_instance()
 
-    def tearDown(self):
-        shutil.rmtree(self.test_dir)
-        ConfigManager._instance = None
+    def use_config(self, **overrides):
+        """Install the base config plus overrides without a JSON round trip through disk."""
+        self.config_manager._config = {**self._base_config, **overrides}
 
-    def create_mock_agent(self, name, class_name):
-        agent_path = os.path.join(self.agents_dir, name)
+    @classmethod
+    def create_mock_agent(cls, name, class_name):
+        agent_path = os.path.join(cls.agents_dir, name)
         os.makedirs(agent_path, exist_ok=True)
 
         # Manifest
@@ -59,17 +69,14 @@ class {class_name}(BaseAgent):
     def execute(self, task: str):
         return f"output from {name}: {{task}}"
 """
-        with open(os.path.join(agent_path, 'agent.py'), 'w') as f:
+        script_path = os.path.join(agent_path, 'agent.py')
+        with open(script_path, 'w') as f:
             f.write(script_content)
+        # Warm __pycache__ so every orchestrator load reuses the compiled bytecode
+        py_compile.compile(script_path, doraise=True)
 
     def test_execution_order_respected(self):
-        config_data = {
-            "agents": {"directory": self.agents_dir},
-            "agent_execution_order": ["agent_c", "agent_a", "agent_b"]
-        }
-        with open(self.config_path, 'w') as f:
-            json.dump(config_data, f)
-        self.config_manager.load_config(self.config_path)
+        self.use_config(agent_execution_order=["agent_c", "agent_a", "agent_b"])
 
         orchestrator = AgentOrchestrator(self.config_manager)
         orchestrator.run_sequence("initial_task")
@@ -78,34 +85,19 @@ class {class_name}(BaseAgent):
         self.assertEqual(execution_sequence, ['AgentC', 'AgentA', 'AgentB'])
 
     def test_missing_execution_order_executes_all(self):
-        config_data = {"agents": {"directory": self.agents_dir}}
-        with open(self.config_path, 'w') as f:
-            json.dump(config_data, f)
-        self.config_manager.load_config(self.config_path)
+        self.use_config()
 
         orchestrator = AgentOrchestrator(self.config_manager)
         self.assertEqual(len(orchestrator.get_execution_sequence()), 3)
 
     def test_agent_not_found_raises_error(self):
-        config_data = {
-            "agents": {"directory": self.agents_dir},
-            "agent_execution_order": ["agent_a", "agent_dne"]
-        }
-        with open(self.config_path, 'w') as f:
-            json.dump(config_data, f)
-        self.config_manager.load_config(self.config_path)
+        self.use_config(agent_execution_order=["agent_a", "agent_dne"])
 
         with self.assertRaises(ValueError):
             AgentOrchestrator(self.config_manager)
 
     def test_data_passing_between_agents(self):
-        config_data = {
-            "agents": {"directory": self.agents_dir},
-            "agent_execution_order": ["agent_a", "agent_b"]
-        }
-        with open(self.config_path, 'w') as f:
-            json.dump(config_data, f)
-        self.config_manager.load_config(self.config_path)
+        self.use_config(agent_execution_order=["agent_a", "agent_b"])
 
         orchestrator = AgentOrchestrator(self.config_manager)
         final_output = orchestrator.run_sequence("start")
@@ -0,0 +1,13 @@
+"""
+Lightweight test doubles shared across the test suite.
+"""
+from unittest.mock import Mock
+
+
+class StubConfigManager:
+    """Plain stand-in for ConfigManager, answering get() from a dict of dotted keys."""
+    
+    def __init__(self, values, agent_config=None):
+        # dict.get already has the ConfigManager.get(key, default) signature
+        self.get = values.get
+        self.get_agent_config = Mock(return_value=agent_config or {})
@@ -1,31 +1,21 @@
 #!/usr/bin/env python3
 
 import unittest
-import os
+import shutil
 import tempfile
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 from pathlib import Path
 
-# Add the project root to the path
-import sys
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..'))
-
 from agents.prompt_assembly_agent.agent import PromptAssemblyAgent
 from core.context_manager import ContextManager
 
 
 class TestPromptAssemblyAgent(unittest.TestCase):
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.context_manager = ContextManager()
-        self.context_manager.set('project_name', 'Test Project')
-        self.context_manager.set('user_name', 'Test User')
-        
-        self.agent = PromptAssemblyAgent(context_manager=self.context_manager)
-        
-        # Create a temporary template for testing
-        self.test_template_content = """# {{ title }}
+    @classmethod
+    def setUpClass(cls):
+        """Write the shared test template once for the class."""
+        cls.test_template_content = """# {{ title }}
 
 ## Description
 {{ description }}
@@ -38,16 +28,23 @@ User: {{ context.user_name }}
 - Param1: {{ param1 }}
 - Param2: {{ param2 }}"""
         
-        # Create template file in the agent's templates directory
-        self.agent.templates_path.mkdir(parents=True, exist_ok=True)
-        self.test_template_path = self.agent.templates_path / 'test_template.md'
-        with open(self.test_template_path, 'w') as f:
-            f.write(self.test_template_content)
+        # Create template file in a private templates directory instead of the package
+        cls.templates_path = Path(tempfile.mkdtemp(prefix='prompt_templates_'))
+        cls.test_template_path = cls.templates_path / 'test_template.md'
+        cls.test_template_path.write_text(cls.test_template_content)
     
-    def tearDown(self):
+    @classmethod
+    def tearDownClass(cls):
         """Clean up test fixtures."""
-        if self.test_template_path.exists():
-            self.test_template_path.unlink()
+        shutil.rmtree(cls.templates_path)
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.context_manager = ContextManager()
+        self.context_manager.set('project_name', 'Test Project')
+        self.context_manager.set('user_name', 'Test User')
+        
+        self.agent = PromptAssemblyAgent(context_manager=self.context_manager, templates_path=self.templates_path)
     
     def test_load_template_success(self):
         """Test successful template loading."""
@@ -59,6 +56,22 @@ User: {{ context.user_name }}
         content = self.agent._load_template('test_template.md')
         self.assertEqual(content, self.test_template_content)
     
+    def test_load_template_reuses_unchanged_file(self):
+        """Test that an unchanged template is served from the cache without reopening it."""
+        self.agent._load_template('test_template')
+        with patch('builtins.open') as mock_open:
+            content = self.agent._load_template('test_template')
+        mock_open.assert_not_called()
+        self.assertEqual(content, self.test_template_content)
+    
+    def test_load_template_rereads_changed_file(self):
+        """Test that editing a template invalidates its cached content."""
+        self.agent._load_template('test_template')
+        self.addCleanup(self.test_template_path.write_text, self.test_template_content)
+        self.test_template_path.write_text('Changed: {{ title }}')
+        
+        self.assertEqual(self.agent._load_template('test_template'), 'Changed: {{ title }}')
+    
     def test_load_template_not_found(self):
         """Test template loading with non-existent template."""
         with self.assertRaises(FileNotFoundError):
@@ -92,29 +105,32 @@ User: {{ context.user_name }}
         expected = "Title: My Title, Project: Test Project, Param: Value1"
         self.assertEqual(result, expected)
     
-    def test_execute_success(self):
-        """Test successful prompt assembly execution."""
+    def test_replace_placeholders_inserts_values_verbatim(self):
+        """Test that replacement values are not re-scanned or treated as regex escapes."""
+        template = "Path: {{ path }}, Next: {{ next }}, Missing: {{ missing }}"
+        placeholders = {'path': r'C:\new\dir', 'next': '{{ path }}'}
+        
+        result = self.agent._replace_placeholders(template, placeholders, {})
+        expected = r"Path: C:\new\dir, Next: {{ path }}, Missing: {{ missing }}"
+        self.assertEqual(result, expected)
+    
+    def test_assemble_template(self):
+        """Test rendering a template with placeholders and context values."""
         placeholders = {
             'title': 'Code Review',
             'description': 'Review the following code changes',
             'param1': 'Check security',
             'param2': 'Verify tests'
         }
-        context_keys = ['project_name', 'user_name']
+        context_values = self.agent._get_context_values(['project_name', 'user_name'])
         
-        result = self.agent.execute('test_template', placeholders, context_keys)
+        result = self.agent._replace_placeholders(self.agent._load_template('test_template'), placeholders, context_values)
         
         # Verify the template was assembled correctly
-        self.assertIn('# Code Review', result)
-        self.assertIn('Review the following code changes', result)
-        self.assertIn('Project: Test Project', result)
-        self.assertIn('User: Test User', result)
-        self.assertIn('Check security', result)
-        self.assertIn('Verify tests', result)
-        
-        # Verify context was updated
-        self.assertEqual(self.context_manager.get('assembled_prompt'), result)
-        self.assertEqual(self.context_manager.get('last_template_used'), 'test_template')
+        needles = ('# Code Review', 'Review the following code changes', 'Project: Test Project',
+                   'User: Test User', 'Check security', 'Verify tests')
+        missing = [needle for needle in needles if needle not in result]
+        self.assertEqual(missing, [], result)
     
     def test_execute_with_defaults(self):
         """Test execution with default parameters."""
@@ -137,20 +153,15 @@ User: {{ context.user_name }}
     
     def test_execute_no_context_manager(self):
         """Test execution without context manager."""
-        agent_without_context = PromptAssemblyAgent()
+        agent_without_context = PromptAssemblyAgent(templates_path=self.templates_path)
         
         # Create template in the agent's templates directory
-        agent_without_context.templates_path.mkdir(parents=True, exist_ok=True)
-        test_template_path = agent_without_context.templates_path / 'simple_template.md'
-        with open(test_template_path, 'w') as f:
-            f.write('Simple template: {{ title }}')
+        test_template_path = self.templates_path / 'simple_template.md'
+        test_template_path.write_text('Simple template: {{ title }}')
+        self.addCleanup(test_template_path.unlink)
         
-        try:
-            result = agent_without_context.execute('simple_template', {'title': 'Test'})
-            self.assertEqual(result, 'Simple template: Test')
-        finally:
-            if test_template_path.exists():
-                test_template_path.unlink()
+        result = agent_without_context.execute('simple_template', {'title': 'Test'})
+        self.assertEqual(result, 'Simple template: Test')
 
 
 if __name__ == '__main__':
@@ -3,48 +3,51 @@
 Unit tests for the feature request functionality in ProjectAnalysisAgent.
 """
 
-import sys
-import os
+import functools
+import inspect
 import unittest
-from unittest.mock import Mock, patch
-
-# Add the project root to the Python path
-sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from unittest.mock import patch
 
 from agents.project_analysis_agent.agent import ProjectAnalysisAgent
 from core.context_manager import ContextManager
 
 
+@functools.lru_cache(maxsize=None)
+def _sig(fn):
+    """Return the (cached) signature of a plain function."""
+    return inspect.signature(fn)
+
+
 class TestFeatureRequestFunctionality(unittest.TestCase):
     """Test cases for feature request functionality."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.context_manager = ContextManager()
-        self.agent = ProjectAnalysisAgent(
+    @classmethod
+    def setUpClass(cls):
+        """Set up one agent for the class with a canned project scan, so no test walks the filesystem."""
+        cls.context_manager = ContextManager()
+        cls.agent = ProjectAnalysisAgent(
             config={},
             llm_manager=None,
-            context_manager=self.context_manager
+            context_manager=cls.context_manager,
+            project_scan=("stub/\n  main.py (10 bytes)", "=== README.md ===\nStub project\n")
         )
     
-    def test_feature_request_parameter(self):
-        """Test that feature request is properly accepted as parameter."""
-        feature_request = "Implement user authentication with OAuth"
-        
-        # Execute with feature request
-        result = self.agent.execute(feature_request)
-        
-        # Should complete without error
-        self.assertIsInstance(result, str)
-        self.assertTrue(len(result) > 0)
+    def setUp(self):
+        """Start each test with an empty context."""
+        self.context_manager.clear()
     
-    def test_default_feature_request(self):
-        """Test that agent works with default feature request."""
-        result = self.agent.execute()
-        
-        # Should complete without error
-        self.assertIsInstance(result, str)
-        self.assertTrue(len(result) > 0)
+    def test_feature_request_parameter(self):
+        """Test that execute accepts a feature request and falls back to the default."""
+        for feature_request in (None, "Implement user authentication with OAuth", "Add REST API endpoints"):
+            with self.subTest(feature_request=feature_request):
+                if feature_request is None:
+                    result = self.agent.execute()
+                else:
+                    result = self.agent.execute(feature_request)
+                
+                # Should complete without error
+                self.assertIsInstance(result, str)
+                self.assertTrue(len(result) > 0)
     
     def test_context_storage(self):
         """Test that project structure is stored in context."""
@@ -59,11 +62,20 @@ class TestFeatureRequestFunctionality(unittest.TestCase):
         self.assertIsInstance(structure, str)
         self.assertTrue(len(structure) > 0)
     
+    def test_project_scanned_once_per_agent(self):
+        """Test that repeated executions reuse the first directory walk."""
+        agent = ProjectAnalysisAgent(config={}, llm_manager=None, context_manager=self.context_manager)
+        with patch.object(ProjectAnalysisAgent, '_analyze_directory_structure',
+                          return_value="src/") as mock_walk:
+            agent.execute("Add REST API endpoints")
+            agent.execute()
+        
+        mock_walk.assert_called_once()
+        self.assertEqual(self.context_manager.get("project_structure"), "src/")
+    
     def test_feature_request_signature(self):
         """Test that the execute method has the correct signature."""
-        import inspect
-        
-        sig = inspect.signature(self.agent.execute)
+        sig = _sig(ProjectAnalysisAgent.execute)
         params = list(sig.parameters.keys())
         
         # Should have feature_request as first parameter